@@ -5,14 +5,15 @@ The official asynchronous client for the PyMCP protocol.
 import asyncio
 import logging
 from typing import Any, Dict
-from uuid import UUID, uuid4
+from uuid import UUID
 
+import msgspec
 import websockets
 from pydantic import TypeAdapter, ValidationError
 from websockets.client import ClientConnection
 from websockets.exceptions import WebSocketException
 
-from pymcp.protocols.base_msg import Header
+from pymcp.protocols.base_msg import RequestHeader, new_correlation_id
 from pymcp.protocols.requests import ToolCallRequest, ToolCallRequestBody
 from pymcp.protocols.responses import ErrorResponse, ServerMessage, ToolCallResponse
 
@@ -20,11 +21,22 @@ from .exceptions import ConnectionFailedError, MCPClientError, ToolExecutionErro
 
 logger = logging.getLogger(__name__)
 
+# Built once at import time and shared by all client instances: the adapter
+# compiles the discriminated-union validator for ServerMessage, which would
+# otherwise be rebuilt per MCPClient.
+_SERVER_MESSAGE_ADAPTER = TypeAdapter(ServerMessage)
+
 
 class MCPClient:
     """An asynchronous client for interacting with an MCP server."""
 
-    def __init__(self, host: str, port: int, timeout: float = 10.0):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        timeout: float = 10.0,
+        use_msgpack: bool = False,
+    ):
         """
         Initializes the MCPClient.
 
@@ -32,14 +44,16 @@ class MCPClient:
             host: The server hostname or IP address.
             port: The server port.
             timeout: Default timeout in seconds for operations.
+            use_msgpack: Exchange MessagePack binary frames instead of JSON.
+                         Smaller and faster to encode for structured
+                         payloads; the server detects the encoding per frame.
         """
         self._uri = f"ws://{host}:{port}"
         self._timeout = timeout
+        self._use_msgpack = use_msgpack
         self._connection: ClientConnection | None = None
         self._listener_task: asyncio.Task | None = None
         self._pending_requests: Dict[UUID, asyncio.Future] = {}
-        # Create a TypeAdapter for robust parsing of the response Union type.
-        self._server_message_adapter = TypeAdapter(ServerMessage)
 
     async def connect(self):
         """
@@ -91,35 +105,17 @@ class MCPClient:
             return
 
         try:
-            async for message_json in self._connection:
-                try:
-                    # Use the TypeAdapter for robust discriminated union parsing
-                    response = self._server_message_adapter.validate_json(message_json)
-                    correlation_id = response.header.correlation_id
-                except ValidationError as e:
-                    # Log the specific validation error for better debugging.
-                    logger.warning(
-                        "Failed to parse server message: %s. Raw message: %s",
-                        e,
-                        message_json,
-                    )
-                    continue  # Ignore malformed messages
-
-                future = self._pending_requests.pop(correlation_id, None)
-                if not future or future.done():
-                    logger.warning(
-                        "Received unsolicited response for correlation_id: %s",
-                        correlation_id,
-                    )
+            async for frame in self._connection:
+                if self._use_msgpack:
+                    # Binary frames are never coalesced: one per message.
+                    self._dispatch_response(frame)
                     continue
-
-                if isinstance(response, ToolCallResponse):
-                    future.set_result(response.body.result)
-                elif isinstance(response, ErrorResponse):
-                    exc = ToolExecutionError(
-                        code=response.error.code, message=response.error.message
-                    )
-                    future.set_exception(exc)
+                # The server may coalesce several responses into one frame,
+                # separated by newlines (JSON never contains a raw newline).
+                if isinstance(frame, str):
+                    frame = frame.encode("utf-8")
+                for message_json in frame.split(b"\n"):
+                    self._dispatch_response(message_json)
 
         except websockets.exceptions.ConnectionClosed:
             pass  # Expected when the connection is closed
@@ -135,6 +131,42 @@ class MCPClient:
                         future.set_exception(exc)
                 self._pending_requests.clear()
 
+    def _dispatch_response(self, message_json: bytes):
+        """Parses a single server message and resolves the matching future."""
+        try:
+            # Use the TypeAdapter for robust discriminated union parsing
+            if self._use_msgpack:
+                response = _SERVER_MESSAGE_ADAPTER.validate_python(
+                    msgspec.msgpack.decode(message_json)
+                )
+            else:
+                response = _SERVER_MESSAGE_ADAPTER.validate_json(message_json)
+            correlation_id = response.header.correlation_id
+        except (ValidationError, msgspec.DecodeError) as e:
+            # Log the specific validation error for better debugging.
+            logger.warning(
+                "Failed to parse server message: %s. Raw message: %s",
+                e,
+                message_json,
+            )
+            return  # Ignore malformed messages
+
+        future = self._pending_requests.pop(correlation_id, None)
+        if not future or future.done():
+            logger.warning(
+                "Received unsolicited response for correlation_id: %s",
+                correlation_id,
+            )
+            return
+
+        if isinstance(response, ToolCallResponse):
+            future.set_result(response.body.result)
+        elif isinstance(response, ErrorResponse):
+            exc = ToolExecutionError(
+                code=response.error.code, message=response.error.message
+            )
+            future.set_exception(exc)
+
     async def call(self, tool: str, **args: Any) -> Any:
         """
         Calls a remote tool on the MCP server and waits for the result.
@@ -154,26 +186,48 @@ class MCPClient:
         if not self.is_connected or not self._connection:
             raise MCPClientError("Client is not connected.")
 
-        correlation_id = uuid4()
+        correlation_id = new_correlation_id()
         request = ToolCallRequest(
-            header=Header(correlation_id=correlation_id),
+            header=RequestHeader(correlation_id=correlation_id),
             body=ToolCallRequestBody(tool=tool, args=args),
         )
 
-        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
         self._pending_requests[correlation_id] = future
 
+        # A plain call_later that cancels the future is cheaper than wrapping
+        # every call in asyncio.wait_for, which spawns an extra task per call.
+        timed_out = False
+
+        def _on_timeout():
+            nonlocal timed_out
+            timed_out = True
+            future.cancel()
+
+        timeout_handle = loop.call_later(self._timeout, _on_timeout)
+        if self._use_msgpack:
+            payload = msgspec.msgpack.encode(request)
+        else:
+            payload = msgspec.json.encode(request)
+
         try:
-            await self._connection.send(request.model_dump_json())
-            return await asyncio.wait_for(future, self._timeout)
-        except (WebSocketException, asyncio.TimeoutError) as e:
-            # If we fail, ensure the pending future is removed
+            await self._connection.send(payload)
+            return await future
+        except asyncio.CancelledError:
             self._pending_requests.pop(correlation_id, None)
-            if isinstance(e, asyncio.TimeoutError):
+            if timed_out:
+                # Our timer fired: surface it as a timeout, not a cancellation.
                 raise asyncio.TimeoutError(
                     f"Call to tool '{tool}' timed out after {self._timeout}s"
-                ) from e
+                ) from None
+            raise
+        except WebSocketException as e:
+            # If we fail, ensure the pending future is removed
+            self._pending_requests.pop(correlation_id, None)
             raise MCPClientError(f"Connection error during call: {e}") from e
+        finally:
+            timeout_handle.cancel()
 
     async def __aenter__(self):
         await self.connect()
@@ -21,6 +21,9 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 # Path to the directory containing built-in framework tools.
 # This is an internal constant and not user-configurable.
 CORE_TOOL_REPOS_PATH = Path(__file__).parent / "core_tools"
+# Stringified once: startup code joins this with user repo paths on every
+# invocation and should not re-run Path.__str__ each time.
+CORE_TOOL_REPOS_STR = str(CORE_TOOL_REPOS_PATH)
 
 
 class Settings(BaseSettings):
@@ -45,6 +48,28 @@ class Settings(BaseSettings):
     # PYMCP_USER_TOOL_REPOS="/path/to/tools1,/path/to/tools2"
     tool_repos: List[str] = []
 
+    # Number of server processes. With more than one, each process binds
+    # the same (host, port) with SO_REUSEPORT and the kernel load-balances
+    # incoming connections across them. Requires a platform with
+    # SO_REUSEPORT support (Linux/BSD).
+    workers: int = 1
+
+    # Maximum number of queued responses the per-connection writer task
+    # will coalesce into a single newline-delimited WebSocket frame.
+    send_batch_max: int = 32
+
+    # Worker threads for synchronous (non-cpu_bound) tool execution.
+    tool_threads: int = 32
+
+    # Upper bound (bytes) on a single incoming WebSocket message.
+    max_message_size: int = 2**20
+
+    # Size of the worker pool that processes inbound messages, and the
+    # bound on its shared queue. A full queue applies backpressure to
+    # connections instead of growing unbounded task counts.
+    message_workers: int = 8
+    message_queue_size: int = 1024
+
     # Logging level
     log_level: str = "INFO"
 
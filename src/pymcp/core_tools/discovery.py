@@ -4,12 +4,11 @@ Core discovery tools for the MCP server.
 """
 
 import pymcp
-from pymcp.protocols.tools_def import ToolDefinition
 from pymcp.tools.registry import ToolRegistry
 
 
 @pymcp.tool
-def list_tools_available(tool_registry: ToolRegistry) -> list[ToolDefinition]:
+def list_tools_available(tool_registry: ToolRegistry) -> list[dict]:
     """
     Lists the definitions of all available tools in the MCP server.
 
@@ -19,4 +18,6 @@ def list_tools_available(tool_registry: ToolRegistry) -> list[ToolDefinition]:
     Returns:
         A list of tool definitions, including name, description, and arguments.
     """
-    return tool_registry.get_all_definitions()
+    # The registry caches this JSON-ready dump, so repeated discovery
+    # calls skip re-dumping the Pydantic definition models.
+    return tool_registry.get_all_definitions_dump()
@@ -9,10 +9,12 @@ from typing import List, Optional
 from . import config
 from .server.server import MCPServer
 from .tools.loader import ToolLoader
-from .tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long stop() waits for task cleanup before giving up.
+SHUTDOWN_TIMEOUT = 10.0
+
 
 class ServerHandle:
     """
@@ -20,10 +22,18 @@ class ServerHandle:
     This handle manages both the server task and the tool watcher task.
     """
 
+    __slots__ = ("_server_task", "_watcher_task", "_tasks")
+
     def __init__(self, server_task: asyncio.Task, watcher_task: asyncio.Task):
         self._server_task = server_task
         self._watcher_task = watcher_task
-        self._tasks = [self._server_task, self._watcher_task]
+        self._tasks = (self._server_task, self._watcher_task)
+        for task in self._tasks:
+            # Log each task as it finishes so shutdown progress is visible
+            # without waiting for the slowest sibling.
+            task.add_done_callback(
+                lambda t: logger.debug("Task '%s' finished.", t.get_name())
+            )
 
     async def stop(self):
         """
@@ -33,7 +43,19 @@ class ServerHandle:
         for task in self._tasks:
             if not task.done():
                 task.cancel()
-        await asyncio.gather(*self._tasks, return_exceptions=True)
+        try:
+            # Cancellations were all issued above, so the tasks clean up
+            # concurrently; the timeout stops a misbehaving task from
+            # hanging the caller's shutdown forever.
+            await asyncio.wait_for(
+                asyncio.gather(*self._tasks, return_exceptions=True),
+                timeout=SHUTDOWN_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Shutdown did not complete within %.0fs; abandoning remaining tasks.",
+                SHUTDOWN_TIMEOUT,
+            )
         logger.info("Server and watcher have been stopped.")
 
     async def wait_closed(self):
@@ -75,18 +97,21 @@ async def start_server(
     Returns:
         A `ServerHandle` instance for controlling the running server.
     """
-    server_host = host if host is not None else config.settings.host
-    server_port = port if port is not None else config.settings.port
+    # Bind the settings object once; each attribute read goes through the
+    # pydantic-settings model.
+    settings = config.settings
+    server_host = host if host is not None else settings.host
+    server_port = port if port is not None else settings.port
 
     # If user_tool_repos is explicitly passed, it takes precedence over settings.
     # Otherwise, use the repos from the settings (env/.env file).
     repos_to_load = (
-        user_tool_repos if user_tool_repos is not None else config.settings.tool_repos
+        user_tool_repos if user_tool_repos is not None else settings.tool_repos
     )
 
     # Use dict.fromkeys to remove duplicates while preserving order.
     tool_repo_paths = list(
-        dict.fromkeys([str(config.CORE_TOOL_REPOS_PATH)] + repos_to_load)
+        dict.fromkeys((config.CORE_TOOL_REPOS_STR, *repos_to_load))
     )
 
     tool_loader = ToolLoader(repo_paths=tool_repo_paths)
@@ -96,14 +121,16 @@ async def start_server(
         host=server_host,
         port=server_port,
         tool_registry=initial_registry,
+        send_batch_max=settings.send_batch_max,
+        message_workers=settings.message_workers,
+        message_queue_size=settings.message_queue_size,
+        max_message_size=settings.max_message_size,
+        tool_threads=settings.tool_threads,
     )
 
-    async def on_registry_update(new_registry: ToolRegistry):
-        server.update_tool_registry(new_registry)
-
     server_task = asyncio.create_task(server.start(), name="MCPServer_Lib")
     watcher_task = asyncio.create_task(
-        tool_loader.watch(on_registry_update), name="ToolWatcher_Lib"
+        tool_loader.watch(server.apply_registry_update), name="ToolWatcher_Lib"
     )
 
     logger.info(
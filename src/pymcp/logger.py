@@ -17,4 +17,9 @@ def setup_logging(level=logging.INFO):
     """
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     logging.basicConfig(level=level, stream=sys.stdout, format=log_format)
+    # The format above uses none of these fields, so skip collecting
+    # thread/process info on every log record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
@@ -9,14 +9,26 @@ from typing import List
 
 from pymcp import config
 from pymcp.logger import setup_logging
-from pymcp.server.server import MCPServer
-from pymcp.tools.loader import ToolLoader
-from pymcp.tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
 
-async def main(host: str, port: int, tool_repos: List[str]):
+def _install_uvloop():
+    """
+    Switches the event loop policy to uvloop when it is installed.
+
+    uvloop is an optional dependency (pip install pymcp[uvloop]); the
+    selector loop is used when it is absent.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+    logger.debug("Using uvloop event loop policy.")
+
+
+async def main(host: str, port: int, tool_repos: List[str], reuse_port: bool = False):
     """
     Sets up and runs the MCP server and its related services.
 
@@ -24,7 +36,14 @@ async def main(host: str, port: int, tool_repos: List[str]):
         host: The network host to bind the server to.
         port: The port to listen on.
         tool_repos: A list of directory paths to search for tools.
+        reuse_port: Bind with SO_REUSEPORT so sibling worker processes can
+                    share the same port.
     """
+    # Imported here rather than at module scope so `pymcp --help` does not
+    # pay for the websockets/watchdog import cascade.
+    from pymcp.server.server import MCPServer
+    from pymcp.tools.loader import ToolLoader
+
     tool_loader = ToolLoader(repo_paths=tool_repos)
     initial_registry = tool_loader.load_registry()
 
@@ -32,17 +51,14 @@ async def main(host: str, port: int, tool_repos: List[str]):
         host=host,
         port=port,
         tool_registry=initial_registry,
+        send_batch_max=config.settings.send_batch_max,
+        reuse_port=reuse_port,
+        message_workers=config.settings.message_workers,
+        message_queue_size=config.settings.message_queue_size,
+        max_message_size=config.settings.max_message_size,
+        tool_threads=config.settings.tool_threads,
     )
 
-    async def on_registry_update(new_registry: ToolRegistry):
-        server.update_tool_registry(new_registry)
-
-    server_task = asyncio.create_task(server.start(), name="MCPServer_CLI")
-    watcher_task = asyncio.create_task(
-        tool_loader.watch(on_registry_update), name="ToolWatcher_CLI"
-    )
-
-    tasks = [server_task, watcher_task]
     logger.info(
         "MCP Server and Tool Watcher are running on ws://%s:%s. Press Ctrl+C to stop.",
         host,
@@ -50,17 +66,66 @@ async def main(host: str, port: int, tool_repos: List[str]):
     )
 
     try:
-        await asyncio.gather(*tasks)
+        # TaskGroup cancels the sibling as soon as either task fails, unlike
+        # gather, which would leave the watcher running after a server crash.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(server.start(), name="MCPServer_CLI")
+            tg.create_task(
+                tool_loader.watch(server.apply_registry_update), name="ToolWatcher_CLI"
+            )
     except asyncio.CancelledError:
         logger.info("Shutdown signal received. Gracefully stopping...")
+    except ExceptionGroup:
+        logger.exception("A server task failed; its sibling was cancelled.")
+        raise
     finally:
-        for task in tasks:
-            if not task.done():
-                task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
         logger.info("Application has shut down gracefully.")
 
 
+def _worker_main(host: str, port: int, tool_repos: List[str], log_level: int):
+    """
+    Entry point for a single worker process in multi-process mode.
+    Each worker runs its own event loop, tool loader, and watcher.
+    """
+    setup_logging(level=log_level)
+    _install_uvloop()
+    try:
+        asyncio.run(main(host=host, port=port, tool_repos=tool_repos, reuse_port=True))
+    except KeyboardInterrupt:
+        pass
+
+
+def _run_workers(
+    workers: int, host: str, port: int, tool_repos: List[str], log_level: int
+):
+    """
+    Spawns `workers` server processes all bound to the same (host, port)
+    via SO_REUSEPORT, letting the kernel fan incoming connections out
+    across processes. This sidesteps the GIL for CPU-bound tool workloads.
+    """
+    import multiprocessing
+
+    processes = [
+        multiprocessing.Process(
+            target=_worker_main,
+            args=(host, port, tool_repos, log_level),
+            name=f"pymcp-worker-{i}",
+        )
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    logger.info("Started %d worker processes on ws://%s:%s", workers, host, port)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+
 def run_cli():
     """
     Parses command-line arguments and runs the main server function.
@@ -88,6 +153,13 @@ def run_cli():
         help="Path to a user tool repository. Can be specified multiple times. "
         "Adds to repos from PYMCP_USER_TOOL_REPOS.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=config.settings.workers,
+        help="Number of server processes sharing the port via SO_REUSEPORT. "
+        f"Env: PYMCP_WORKERS (default: {config.settings.workers})",
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -106,13 +178,24 @@ def run_cli():
     # The final list always includes the core tools path first.
     # Use dict.fromkeys to remove duplicates while preserving order.
     final_tool_repos = list(
-        dict.fromkeys([str(config.CORE_TOOL_REPOS_PATH)] + all_user_repos)
+        dict.fromkeys((config.CORE_TOOL_REPOS_STR, *all_user_repos))
     )
 
     # Configure logging for the entire application. The CLI arg takes precedence.
     log_level_value = getattr(logging, args.log_level.upper())
     setup_logging(level=log_level_value)
 
+    if args.workers > 1:
+        _run_workers(
+            workers=args.workers,
+            host=args.host,
+            port=args.port,
+            tool_repos=final_tool_repos,
+            log_level=log_level_value,
+        )
+        return
+
+    _install_uvloop()
     try:
         asyncio.run(main(host=args.host, port=args.port, tool_repos=final_tool_repos))
     except KeyboardInterrupt:
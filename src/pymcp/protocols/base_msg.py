@@ -1,7 +1,33 @@
 # src/pymcp/protocols/base_msg.py
+import itertools
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
+
+# Correlation IDs only need to be unique, not unpredictable, so the
+# syscall-backed RNG of uuid4() is wasted per-message cost. A random
+# per-process 64-bit prefix (drawn once) combined with a monotonic counter
+# keeps IDs unique within and across processes at the cost of a single
+# counter increment.
+_ID_PREFIX = uuid4().int & ((1 << 64) - 1)
+_ID_COUNTER = itertools.count()
+
+
+def new_correlation_id() -> UUID:
+    """Returns a process-unique correlation ID without invoking the RNG."""
+    return UUID(int=(_ID_PREFIX << 64) | next(_ID_COUNTER))
+
+
+class RequestHeader(msgspec.Struct):
+    """
+    Metadata for every inbound MCP request.
+
+    This is the msgspec counterpart of `Header`, used on the request path
+    where decoding speed matters most. Responses keep the Pydantic `Header`.
+    """
+
+    correlation_id: UUID = msgspec.field(default_factory=new_correlation_id)
 
 
 class Header(BaseModel):
@@ -11,7 +37,9 @@ class Header(BaseModel):
     and is now a top-level field on response messages for discrimination.
     """
 
-    correlation_id: UUID = Field(default_factory=uuid4)
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
+    correlation_id: UUID = Field(default_factory=new_correlation_id)
 
 
 class Error(BaseModel):
@@ -19,17 +47,15 @@ class Error(BaseModel):
     Standardized error format.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
     code: str
     message: str
 
 
-class MCPRequest(BaseModel):
-    """Base model for all client-to-server requests."""
-
-    header: Header = Field(default_factory=Header)
-
-
 class MCPResponse(BaseModel):
     """Base model for all server-to-client responses."""
 
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
     header: Header
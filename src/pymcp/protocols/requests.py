@@ -1,20 +1,24 @@
 # src/pymcp/protocols/requests.py
 from typing import Any, Dict
 
-from pydantic import BaseModel
+import msgspec
 
-from .base_msg import MCPRequest
+from .base_msg import RequestHeader
 
 
 # Tool Call
-class ToolCallRequestBody(BaseModel):
+#
+# Requests are msgspec Structs rather than Pydantic models: one is decoded for
+# every inbound WebSocket frame, and msgspec's C decoder validates and builds
+# them far faster than Pydantic. Responses remain Pydantic models.
+class ToolCallRequestBody(msgspec.Struct):
     tool: str
     args: Dict[str, Any]
 
 
-class ToolCallRequest(MCPRequest):
-    # The header is inherited from MCPRequest and no longer needs a status.
+class ToolCallRequest(msgspec.Struct):
     body: ToolCallRequestBody
+    header: RequestHeader = msgspec.field(default_factory=RequestHeader)
 
 
 ClientMessage = ToolCallRequest
@@ -1,13 +1,17 @@
 # src/pymcp/protocols/responses.py
-from typing import Any, Literal, Union
+from typing import Annotated, Any, Literal, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 from .base_msg import Error, MCPResponse
 
 
 # Tool Call Response
 class ToolCallResponseBody(BaseModel):
+    # These models are created once per message; frozen=True lets
+    # pydantic-core skip its mutation machinery on instantiation.
+    model_config = ConfigDict(frozen=True)
+
     tool: str
     result: Any
 
@@ -28,5 +32,13 @@ class ErrorResponse(MCPResponse):
     error: Error
 
 
-# This is now a valid discriminated union that Pydantic can parse automatically.
-ServerMessage = Union[ToolCallResponse, ErrorResponse]
+# A discriminated union: tagging on 'status' lets Pydantic pick the variant
+# with a single dict lookup instead of trying each member in turn.
+ServerMessage = Annotated[
+    Union[ToolCallResponse, ErrorResponse], Field(discriminator="status")
+]
+
+# Force schema and serializer construction at import time so the first
+# message on a fresh process does not pay for it.
+ToolCallResponse.model_rebuild()
+ErrorResponse.model_rebuild()
@@ -1,12 +1,16 @@
 # src/pymcp/protocols/tools_def.py
 
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ToolArgument(BaseModel):
     """Describes a single argument for a tool."""
 
+    # Instances are shared across tools (see the registry's flyweight
+    # pool), so they must stay immutable.
+    model_config = ConfigDict(frozen=True)
+
     name: str
     type: str
     required: bool = True
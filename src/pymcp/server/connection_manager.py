@@ -1,27 +1,72 @@
 # src/pymcp/server/connection_manager.py
 import asyncio
+import collections
 import logging
 from typing import Dict
-from uuid import UUID, uuid4
 
-import websockets
+from websockets.exceptions import ConnectionClosed
+from websockets.protocol import State
 from websockets.server import ServerConnection
 
-from pymcp.protocols.responses import ServerMessage
-
 logger = logging.getLogger(__name__)
 
 
-class ConnectionManager:
-    """Manages active WebSocket connections."""
+class SendBuffer:
+    """
+    A single-producer/single-consumer outbound buffer for one connection.
+
+    A plain deque plus an Event is cheaper than asyncio.Queue, which
+    maintains waiter lists and wakes a future on every put/get. Here the
+    producer only appends and sets the event; the writer task is the sole
+    consumer.
+    """
+
+    __slots__ = ("items", "ready", "batching")
 
     def __init__(self):
-        self.active_connections: Dict[UUID, ServerConnection] = {}
+        self.items: collections.deque = collections.deque()
+        self.ready = asyncio.Event()
+        # Newline coalescing only works for JSON payloads; the first
+        # binary (MessagePack) payload turns it off for the connection.
+        self.batching = True
 
-    async def connect(self, websocket: ServerConnection) -> UUID:
-        """Registers a new connection."""
-        connection_id = uuid4()
+    def push(self, payload: bytes):
+        self.items.append(payload)
+        self.ready.set()
+
+
+class ConnectionManager:
+    """
+    Manages active WebSocket connections.
+
+    Each connection owns an outbound queue drained by a dedicated writer
+    task. When several responses are queued for the same connection, the
+    writer coalesces them (up to `send_batch_max`) into a single
+    newline-delimited frame, amortizing per-frame WebSocket overhead.
+    Batching only happens for responses that are already waiting, so no
+    latency is added on an idle connection.
+    """
+
+    def __init__(self, send_batch_max: int = 32):
+        # Connection IDs are process-local, so a monotonically increasing
+        # int is used as the key: hashing an int is much cheaper than
+        # hashing a UUID, and this dict is hit on every send.
+        self.active_connections: Dict[int, ServerConnection] = {}
+        self._send_buffers: Dict[int, SendBuffer] = {}
+        self._writer_tasks: Dict[int, asyncio.Task] = {}
+        self._next_connection_id = 0
+        self._send_batch_max = send_batch_max
+
+    async def connect(self, websocket: ServerConnection) -> int:
+        """Registers a new connection and starts its writer task."""
+        connection_id = self._next_connection_id
+        self._next_connection_id += 1
         self.active_connections[connection_id] = websocket
+        buffer = SendBuffer()
+        self._send_buffers[connection_id] = buffer
+        self._writer_tasks[connection_id] = asyncio.create_task(
+            self._writer(websocket, buffer), name=f"ConnWriter_{connection_id}"
+        )
         remote_addr = websocket.remote_address
         logger.info(
             "Connection %s accepted from %s:%s",
@@ -31,19 +76,43 @@ class ConnectionManager:
         )
         return connection_id
 
-    def disconnect(self, connection_id: UUID):
-        """Removes a connection."""
+    def disconnect(self, connection_id: int):
+        """Removes a connection and stops its writer task."""
         if connection_id in self.active_connections:
             del self.active_connections[connection_id]
+            del self._send_buffers[connection_id]
+            self._writer_tasks.pop(connection_id).cancel()
             # Logging is handled by the server handler for more context (clean vs. unclean shutdown)
 
-    async def send_message(self, connection_id: UUID, message: ServerMessage):
-        """Sends a JSON-serializable message to a specific client."""
-        websocket = self.active_connections.get(connection_id)
-        if websocket:
+    def get_send_buffer(self, connection_id: int) -> SendBuffer | None:
+        """
+        Returns the connection's outbound buffer, so the processing
+        pipeline can push responses without re-hashing the connection id
+        for every message.
+        """
+        return self._send_buffers.get(connection_id)
+
+    async def _writer(self, websocket: ServerConnection, buffer: SendBuffer):
+        """
+        Drains a connection's outbound buffer, coalescing bursts of queued
+        responses into a single newline-delimited frame.
+        """
+        items = buffer.items
+        while True:
+            if not items:
+                buffer.ready.clear()
+                await buffer.ready.wait()
+            batch = [items.popleft()]
+            if buffer.batching:
+                while items and len(batch) < self._send_batch_max:
+                    batch.append(items.popleft())
+            frame = batch[0] if len(batch) == 1 else b"\n".join(batch)
+            if websocket.state is not State.OPEN:
+                # Cheap identity check: skip the send (and the exception
+                # unwind it would trigger) once the socket is closing.
+                return
             try:
-                await websocket.send(message.model_dump_json())
-            except websockets.exceptions.ConnectionClosed:
+                await websocket.send(frame)
+            except ConnectionClosed:
                 # Disconnect will be handled by the reading task in the main server handler
-                pass
-
+                return
@@ -2,26 +2,52 @@
 """
 Service responsible for sending responses to clients.
 """
-from uuid import UUID
+import msgspec
 
 from pymcp.protocols.responses import ServerMessage
 
-from .connection_manager import ConnectionManager
+from .connection_manager import SendBuffer
+
+# A single reusable encoder for the outbound path. Encoding the
+# JSON-compatible dump of a response through msgspec's C encoder is much
+# cheaper than Pydantic's own JSON serializer, and it yields bytes that
+# `websockets` can send without a str -> bytes encode.
+_ENCODER = msgspec.json.Encoder()
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
 
 
 class ResponseSender:
     """
-    A service that encapsulates the logic for sending messages
-    to clients via the ConnectionManager.
+    A service that encapsulates the logic for sending messages to clients.
+
+    Responses are serialized here, in the processing worker, and pushed
+    onto the connection's own outbound buffer — no per-send dict lookup —
+    so the per-connection writer tasks touch nothing but ready-to-send
+    bytes.
     """
 
-    def __init__(self, connection_manager: ConnectionManager):
-        self.connection_manager = connection_manager
+    def send(
+        self, buffer: SendBuffer, message: ServerMessage, msgpack: bool = False
+    ):
+        """
+        Serializes a message and queues it on a connection's buffer,
+        matching the encoding the client used for its request.
+
+        Queueing never suspends, so this is a plain function: the caller
+        saves a coroutine-frame allocation per response.
+        """
+        dump = message.model_dump(mode="json")
+        if msgpack:
+            # Binary frames cannot take part in newline batching.
+            buffer.batching = False
+            buffer.push(_MSGPACK_ENCODER.encode(dump))
+        else:
+            buffer.push(_ENCODER.encode(dump))
 
-    async def send(self, connection_id: UUID, message: ServerMessage):
+    def send_raw(self, buffer: SendBuffer, payload: bytes, batchable: bool = True):
         """
-        Sends a message to a specific client.
+        Queues an already-serialized payload, e.g. a templated error.
         """
-        await self.connection_manager.send_message(
-            connection_id=connection_id, message=message
-        )
+        if not batchable:
+            buffer.batching = False
+        buffer.push(payload)
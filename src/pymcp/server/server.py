@@ -5,19 +5,16 @@ The main MCP server orchestrator.
 
 import asyncio
 import logging
-from uuid import UUID
+from concurrent.futures import ThreadPoolExecutor
 
 import websockets
 from websockets.server import ServerConnection
 
-from pymcp.protocols.base_msg import Error
-from pymcp.protocols.requests import ClientMessage, ToolCallRequest
-from pymcp.protocols.responses import ErrorResponse
+from pymcp.protocols.requests import ClientMessage
 from pymcp.tools.registry import ToolRegistry
 
-from .connection_manager import ConnectionManager
+from .connection_manager import ConnectionManager, SendBuffer
 from .response_sender import ResponseSender
-from .router import Router
 from .tool_executor import ToolExecutor
 from .validator import Validator
 
@@ -35,19 +32,31 @@ class MCPServer:
         host: str,
         port: int,
         tool_registry: ToolRegistry,
+        send_batch_max: int = 32,
+        reuse_port: bool = False,
+        message_workers: int = 8,
+        message_queue_size: int = 1024,
+        max_message_size: int = 2**20,
+        tool_threads: int = 32,
     ):
         self.host = host
         self.port = port
+        self.reuse_port = reuse_port
+        self.max_message_size = max_message_size
+        self.tool_threads = tool_threads
 
         # Core components (services)
-        self.connection_manager = ConnectionManager()
+        self.connection_manager = ConnectionManager(send_batch_max=send_batch_max)
         self.validator = Validator()
-        self.router = Router()
         self.tool_executor = ToolExecutor(tool_registry)
-        self.response_sender = ResponseSender(self.connection_manager)
+        self.response_sender = ResponseSender()
 
-        # To keep track of running tasks for graceful shutdown
-        self._running_tasks: set[asyncio.Task] = set()
+        # A fixed pool of worker coroutines drains this queue instead of
+        # spawning a task per message: no Task allocation on the hot path,
+        # and the bounded queue applies backpressure to fast producers.
+        self._message_queue: asyncio.Queue = asyncio.Queue(maxsize=message_queue_size)
+        self._message_workers = message_workers
+        self._worker_tasks: list[asyncio.Task] = []
 
     def update_tool_registry(self, new_registry: ToolRegistry):
         """
@@ -56,18 +65,28 @@ class MCPServer:
         logger.info("Server is now using the updated tool registry.")
         self.tool_executor.tool_registry = new_registry
 
+    async def apply_registry_update(self, new_registry: ToolRegistry):
+        """
+        Async adapter for `ToolLoader.watch`, which expects an awaitable
+        callback. Passing this bound method avoids a per-startup closure.
+        """
+        self.update_tool_registry(new_registry)
+
     async def _handler(self, websocket: ServerConnection):
         """The main WebSocket handler for each client connection."""
         connection_id = await self.connection_manager.connect(websocket)
         remote_addr = websocket.remote_address
+        # Resolved once per connection; responses are pushed straight onto
+        # this buffer rather than re-looking the connection up per message.
+        send_buffer = self.connection_manager.get_send_buffer(connection_id)
         try:
-            async for message_json in websocket:
-                # Dynamically allocate a worker (task) for each message.
-                task = asyncio.create_task(
-                    self._process_message(connection_id, message_json)
-                )
-                self._running_tasks.add(task)
-                task.add_done_callback(self._running_tasks.discard)
+            while True:
+                # decode=False skips the UTF-8 decode for text frames; the
+                # msgspec decoder in the Validator consumes bytes directly.
+                message_json = await websocket.recv(decode=False)
+                # Hand off to the worker pool; blocks only when the queue
+                # is full, which is the intended backpressure.
+                await self._message_queue.put((send_buffer, message_json))
 
         except websockets.exceptions.ConnectionClosedError:
             logger.warning(
@@ -86,50 +105,86 @@ class MCPServer:
         finally:
             self.connection_manager.disconnect(connection_id)
 
-    async def _process_message(self, connection_id: UUID, message_json: str):
+    async def _process_message(self, send_buffer: SendBuffer, message_json: bytes):
         """
         Orchestrates the processing of a single message by calling services.
         This function runs in its own task for each message.
         """
-        # 1. Validate
-        validated_result = self.validator.validate_message(message_json)
-        if isinstance(validated_result, ErrorResponse):
-            await self.response_sender.send(connection_id, validated_result)
+        # Clients may speak JSON or MessagePack; a JSON request map always
+        # starts with '{', which no MessagePack map encoding begins with.
+        msgpack = message_json[:1] != b"{"
+
+        # 1. Validate. All client messages are tool calls, so a valid
+        # message goes straight to execution; the old Router pass-through
+        # has been folded away. Rejections come back as pre-encoded bytes
+        # in the same encoding as the offending frame.
+        message: ClientMessage = self.validator.validate_message(message_json)
+        if type(message) is bytes:
+            self.response_sender.send_raw(send_buffer, message, batchable=not msgpack)
             return
 
-        message: ClientMessage = validated_result
-
-        # 2. Route
-        immediate_response = self.router.route_request(message)
-        if immediate_response:
-            await self.response_sender.send(connection_id, immediate_response)
-            return
-
-        # 3. Execute
-        # Since validation and routing passed, we know it's a valid tool call.
+        # 2. Execute
         # As ClientMessage is an alias for ToolCallRequest, we can execute directly.
         response_message = await self.tool_executor.execute(message)
 
-        # 4. Send Response
-        await self.response_sender.send(connection_id, response_message)
-
-    async def _shutdown_client_tasks(self):
-        """Gracefully shuts down all client-processing tasks."""
-        if not self._running_tasks:
+        # 3. Send Response. Pushing onto the buffer is synchronous; the
+        # only true suspension point in this pipeline is the execute call.
+        self.response_sender.send(send_buffer, response_message, msgpack=msgpack)
+
+    async def _message_worker(self):
+        """A long-lived worker that processes queued client messages."""
+        queue = self._message_queue
+        while True:
+            send_buffer, message_json = await queue.get()
+            try:
+                await self._process_message(send_buffer, message_json)
+            except Exception:
+                # A failing message must not take the worker down with it.
+                logger.exception("Unhandled error while processing a message.")
+            finally:
+                queue.task_done()
+
+    async def _shutdown_workers(self):
+        """Drains in-flight messages, then stops the worker pool."""
+        if not self._worker_tasks:
             return
-        logger.info("Shutting down %d client tasks...", len(self._running_tasks))
-        await asyncio.gather(*self._running_tasks, return_exceptions=True)
-        logger.info("All client tasks completed.")
+        logger.info("Draining message queue and stopping workers...")
+        await self._message_queue.join()
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks.clear()
+        logger.info("All message workers stopped.")
 
     async def start(self):
         """Starts the WebSocket server and serves until cancelled."""
         logger.info("Starting MCP Server on ws://%s:%s", self.host, self.port)
+        # Sync tools run on the loop's default executor; size it for tool
+        # fan-out instead of relying on asyncio's small default.
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=self.tool_threads, thread_name_prefix="tool")
+        )
+        self._worker_tasks = [
+            asyncio.create_task(self._message_worker(), name=f"MsgWorker_{i}")
+            for i in range(self._message_workers)
+        ]
         try:
             # The websockets.serve context manager handles server startup and shutdown.
-            async with websockets.serve(self._handler, self.host, self.port):
+            # reuse_port lets multiple server processes share the same port
+            # with kernel-level connection load balancing. compression=None
+            # drops permessage-deflate: zlib per frame costs far more than
+            # it saves on the small control messages MCP exchanges.
+            async with websockets.serve(
+                self._handler,
+                self.host,
+                self.port,
+                reuse_port=self.reuse_port,
+                compression=None,
+                max_size=self.max_message_size,
+            ):
                 await asyncio.Future()  # Run forever
         except asyncio.CancelledError:
             logger.info("Server shutdown signal received.")
         finally:
-            await self._shutdown_client_tasks()
+            await self._shutdown_workers()
             logger.info("Server has stopped.")
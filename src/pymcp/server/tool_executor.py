@@ -2,10 +2,13 @@
 """
 Service responsible for executing tools.
 """
-import inspect
+import asyncio
+import functools
+import importlib.util
 import logging
+from concurrent.futures import ProcessPoolExecutor
 
-from pymcp.protocols.base_msg import Error
+from pymcp.protocols.base_msg import Error, Header
 from pymcp.protocols.requests import ToolCallRequest
 from pymcp.protocols.responses import (
     ErrorResponse,
@@ -18,6 +21,28 @@ from pymcp.tools.registry import Tool, ToolRegistry
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_function_from_file(source_path: str, func_name: str):
+    """
+    Loads a tool function by source file inside a process-pool worker.
+
+    Dynamically loaded tool functions cannot be pickled (their module is not
+    importable by name), so workers re-import them from the original file.
+    The lru_cache keeps this a one-time cost per worker process.
+    """
+    spec = importlib.util.spec_from_file_location(
+        f"mcp_pool_tools.{func_name}", source_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, func_name)
+
+
+def _run_cpu_bound_from_file(source_path: str, func_name: str, kwargs: dict):
+    """Executes a file-loaded CPU-bound tool inside a pool worker."""
+    return _load_function_from_file(source_path, func_name)(**kwargs)
+
+
 class ToolExecutor:
     """
     A service that encapsulates the logic for finding and executing a tool.
@@ -26,6 +51,14 @@ class ToolExecutor:
 
     def __init__(self, tool_registry: ToolRegistry):
         self.tool_registry = tool_registry
+        # Created on first use so servers without CPU-bound tools never
+        # pay for worker processes.
+        self._process_pool: ProcessPoolExecutor | None = None
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor()
+        return self._process_pool
 
     async def execute(self, request: ToolCallRequest) -> ServerMessage:
         """
@@ -41,41 +74,68 @@ class ToolExecutor:
             logger.warning(
                 "Tool '%s' not found [correlation_id=%s]", tool_name, correlation_id
             )
-            return ErrorResponse(
+            # All fields here are server-produced and already type-correct,
+            # so model_construct safely skips Pydantic validation.
+            return ErrorResponse.model_construct(
                 status="error",
-                header={"correlation_id": correlation_id},
-                error=Error(
+                header=Header.model_construct(correlation_id=correlation_id),
+                error=Error.model_construct(
                     code="tool_not_found",
                     message=f"Tool '{tool_name}' not found.",
                 ),
             )
 
         try:
-            logger.info(
-                "Executing tool '%s' [correlation_id=%s]", tool_name, correlation_id
-            )
-            # Prepare arguments for execution.
-            execution_args = request.body.args.copy()
-
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Executing tool '%s' [correlation_id=%s]", tool_name, correlation_id
+                )
             # --- Dependency Injection Logic ---
-            # Inspect the tool's actual function signature.
-            sig = inspect.signature(tool.func)
-            # If the function expects the special 'tool_registry' parameter, inject it.
-            if Tool.INJECTED_REGISTRY_PARAM in sig.parameters:
-                execution_args[Tool.INJECTED_REGISTRY_PARAM] = self.tool_registry
+            # If the function expects the special 'tool_registry' parameter,
+            # inject it. Only tools that need injection pay for a new dict;
+            # everyone else uses the decoded args untouched. The check itself
+            # was resolved once at Tool construction.
+            if tool.needs_registry:
+                execution_args = {
+                    **request.body.args,
+                    Tool.INJECTED_REGISTRY_PARAM: self.tool_registry,
+                }
+            else:
+                execution_args = request.body.args
             # This pattern is extensible for other server-side dependencies.
 
-            result = await tool.execute(**execution_args)
+            if tool.cpu_bound and not tool.is_coro:
+                # CPU-bound sync tools escape the GIL in a process pool.
+                # Their arguments and result must be picklable.
+                if tool.source_path:
+                    # Loaded from a tool repo: not picklable, ship by path.
+                    call = functools.partial(
+                        _run_cpu_bound_from_file,
+                        tool.source_path,
+                        tool.func.__name__,
+                        execution_args,
+                    )
+                else:
+                    call = functools.partial(tool.func, **execution_args)
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._get_process_pool(), call
+                )
+            else:
+                result = await tool.dispatch(execution_args)
 
-            logger.debug(
-                "Tool '%s' executed successfully [correlation_id=%s]",
-                tool_name,
-                correlation_id,
-            )
-            # status="success" is set by default in the ToolCallResponse model.
-            return ToolCallResponse(
-                header={"correlation_id": correlation_id},
-                body=ToolCallResponseBody(tool=tool_name, result=result),
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Tool '%s' executed successfully [correlation_id=%s]",
+                    tool_name,
+                    correlation_id,
+                )
+            # status="success" is filled in from the model default.
+            # Trusted internal data: skip validation via model_construct.
+            return ToolCallResponse.model_construct(
+                header=Header.model_construct(correlation_id=correlation_id),
+                body=ToolCallResponseBody.model_construct(
+                    tool=tool_name, result=result
+                ),
             )
         except Exception:
             # Using logger.exception automatically includes stack trace info.
@@ -84,10 +144,10 @@ class ToolExecutor:
                 tool_name,
                 correlation_id,
             )
-            return ErrorResponse(
+            return ErrorResponse.model_construct(
                 status="error",
-                header={"correlation_id": correlation_id},
-                error=Error(
+                header=Header.model_construct(correlation_id=correlation_id),
+                error=Error.model_construct(
                     code="execution_error",
                     message=f"An unexpected error occurred while executing tool '{tool_name}'.",
                 ),
@@ -4,14 +4,47 @@ Component responsible for validating incoming client messages.
 """
 import logging
 
-from pydantic import ValidationError
+import msgspec
 
-from pymcp.protocols.base_msg import Error
 from pymcp.protocols.requests import ClientMessage
-from pymcp.protocols.responses import ErrorResponse
 
 logger = logging.getLogger(__name__)
 
+# Built once at import time: msgspec compiles the decoders for the request
+# schema on construction, so every call is a pure C decode with no setup cost.
+# JSON frames always start with '{' (the request is a map), which is never
+# the first byte of a MessagePack-encoded map, so the two wire encodings
+# can share one connection without any out-of-band negotiation.
+_DECODER = msgspec.json.Decoder(ClientMessage)
+_MSGPACK_DECODER = msgspec.msgpack.Decoder(ClientMessage)
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+
+# Rejections have a constant shape (the correlation_id cannot be trusted
+# when the header itself failed to parse, so it is always the nil UUID).
+# Formatting this byte template is far cheaper than building and dumping
+# an ErrorResponse model per malformed message.
+_ERROR_TEMPLATE = (
+    b'{"header":{"correlation_id":"00000000-0000-0000-0000-000000000000"},'
+    b'"status":"error","body":null,"error":{"code":"%b","message":%b}}'
+)
+
+
+def _error_payload(code: bytes, message: str) -> bytes:
+    # msgspec handles the JSON string escaping of the free-form message.
+    return _ERROR_TEMPLATE % (code, msgspec.json.encode(message))
+
+
+def _msgpack_error_payload(code: str, message: str) -> bytes:
+    # MessagePack clients get the same response shape, binary-encoded.
+    return _MSGPACK_ENCODER.encode(
+        {
+            "header": {"correlation_id": "00000000-0000-0000-0000-000000000000"},
+            "status": "error",
+            "body": None,
+            "error": {"code": code, "message": message},
+        }
+    )
+
 
 class Validator:
     """
@@ -19,39 +52,47 @@ class Validator:
     If validation fails, it returns an error response to be sent to the client.
     """
 
-    def validate_message(
-        self, message_json: str
-    ) -> ClientMessage | ErrorResponse:
+    def validate_message(self, message_json: bytes) -> ClientMessage | bytes:
         """
         Parses and validates a raw client message from a WebSocket.
 
         Args:
-            message_json: The raw JSON string received from the client.
+            message_json: The raw payload received from the client, either
+                          JSON or MessagePack encoded.
 
         Returns:
-            A parsed `ClientMessage` object if validation is successful,
-            or an `ErrorResponse` if validation fails.
+            A parsed `ClientMessage` object if validation is successful, or
+            the ready-to-send error payload (bytes) if validation fails.
+            Error payloads match the encoding of the offending frame.
         """
+        if message_json[:1] == b"{":
+            try:
+                return _DECODER.decode(message_json)
+            except msgspec.ValidationError as e:
+                # For schema violations, we cannot reliably extract a
+                # correlation_id as the header itself might be invalid.
+                logger.warning("Validation failed for incoming message: %s", e)
+                return _error_payload(b"validation_error", str(e))
+            except msgspec.DecodeError as e:
+                # The payload was not valid JSON at all.
+                logger.error("Failed to parse incoming JSON message: %s", e)
+                return _error_payload(b"invalid_json", f"Could not parse message: {e}")
+        # Cheap prefilter: a ClientMessage is always a map, so anything
+        # that is neither a JSON object nor a MessagePack map encoding can
+        # be rejected without running a decoder or allocating a parse tree.
+        lead = message_json[0] if message_json else 0
+        if not (0x80 <= lead <= 0x8F or lead in (0xDE, 0xDF)):
+            logger.warning("Rejected frame with non-map leading byte 0x%02x", lead)
+            return _error_payload(
+                b"invalid_json", "Message is not a JSON object or MessagePack map."
+            )
         try:
-            return ClientMessage.model_validate_json(message_json)
-        except ValidationError as e:
-            # For Pydantic validation errors, we cannot reliably extract a correlation_id
-            # as the header itself might be invalid.
+            return _MSGPACK_DECODER.decode(message_json)
+        except msgspec.ValidationError as e:
             logger.warning("Validation failed for incoming message: %s", e)
-            return ErrorResponse(
-                status="error",
-                header={
-                    "correlation_id": "00000000-0000-0000-0000-000000000000",
-                },
-                error=Error(code="validation_error", message=str(e)),
-            )
-        except Exception as e:
-            # Catch other potential parsing errors (e.g., invalid JSON).
-            logger.error("Failed to parse incoming JSON message: %s", e)
-            return ErrorResponse(
-                status="error",
-                header={
-                    "correlation_id": "00000000-0000-0000-0000-000000000000",
-                },
-                error=Error(code="invalid_json", message=f"Could not parse message: {e}"),
+            return _msgpack_error_payload("validation_error", str(e))
+        except msgspec.DecodeError as e:
+            logger.error("Failed to parse incoming MessagePack message: %s", e)
+            return _msgpack_error_payload(
+                "invalid_msgpack", f"Could not parse message: {e}"
             )
@@ -9,9 +9,18 @@ from typing import Any, Callable, Optional, TypeVar
 F = TypeVar("F", bound=Callable[..., Any])
 
 TOOL_METADATA_ATTR = "_mcp_tool_meta"
+# Set at decoration time from the code object so the registry never has to
+# build an inspect.Signature just to answer "does this tool want injection?".
+NEEDS_REGISTRY_ATTR = "_mcp_needs_registry"
+_INJECTED_REGISTRY_PARAM = "tool_registry"
 
 
-def tool(name: str = None, description: Optional[str] = None) -> Callable[[F], F]:
+def tool(
+    name: str = None,
+    description: Optional[str] = None,
+    cpu_bound: bool = False,
+    inline: bool = False,
+) -> Callable[[F], F]:
     """
     A decorator to mark a function as an MCP tool.
 
@@ -22,6 +31,13 @@ def tool(name: str = None, description: Optional[str] = None) -> Callable[[F], F
         name: The name for the tool. If None, the function's `__name__` is used.
         description: A short description of what the tool does. If None, the
                      function's docstring is used.
+        cpu_bound: Mark a synchronous tool as CPU-heavy. The server will run
+                   it in a process pool instead of a thread, escaping the GIL.
+                   Arguments and result must be picklable.
+        inline: Mark a synchronous tool as trivially cheap. The server calls
+                it directly on the event loop, skipping the thread hop. Only
+                use this for tools that never block and finish in
+                microseconds; a slow inline tool stalls every connection.
 
     Returns:
         A decorator that attaches metadata and returns the function unmodified.
@@ -36,11 +52,36 @@ def tool(name: str = None, description: Optional[str] = None) -> Callable[[F], F
                 f"Tool '{tool_name}' must have a description or a docstring."
             )
 
+        if cpu_bound and inline:
+            raise ValueError(
+                f"Tool '{tool_name}' cannot be both cpu_bound and inline."
+            )
+
         setattr(
             func,
             TOOL_METADATA_ATTR,
-            {"name": tool_name, "description": tool_desc.strip()},
+            {
+                "name": tool_name,
+                "description": tool_desc.strip(),
+                "cpu_bound": cpu_bound,
+                "inline": inline,
+            },
         )
+        try:
+            # co_varnames starts with positional then keyword-only params;
+            # reading it is plain attribute access, far cheaper than
+            # constructing a Signature object.
+            code = func.__code__
+            param_names = code.co_varnames[
+                : code.co_argcount + code.co_kwonlyargcount
+            ]
+            setattr(
+                func, NEEDS_REGISTRY_ATTR, _INJECTED_REGISTRY_PARAM in param_names
+            )
+        except AttributeError:
+            # Non-function callables fall back to signature inspection
+            # when the Tool wrapper is built.
+            pass
         return func
 
     # This logic handles both @tool and @tool(...)
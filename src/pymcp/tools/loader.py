@@ -126,15 +126,24 @@ class ToolLoader:
             spec.loader.exec_module(module)
             self._loaded_module_paths[module_name] = file_path
 
+            tools = []
             for _, member in inspect.getmembers(module):
                 if callable(member) and hasattr(member, TOOL_METADATA_ATTR):
                     meta = getattr(member, TOOL_METADATA_ATTR)
-                    tool_instance = Tool(
-                        name=meta["name"],
-                        func=member,
-                        description=meta["description"],
+                    tools.append(
+                        Tool(
+                            name=meta["name"],
+                            func=member,
+                            description=meta["description"],
+                            cpu_bound=meta.get("cpu_bound", False),
+                            inline=meta.get("inline", False),
+                            source_path=str(file_path),
+                        )
                     )
-                    registry.register(tool_instance)
+            if tools:
+                # One bulk registration per file: the registry rebuilds its
+                # copy-on-write indexes once instead of once per tool.
+                registry.register_many(tools)
         except Exception as e:
             logger.error("Error loading tools from %s: %s", file_path, e)
 
@@ -1,13 +1,128 @@
 # src/pymcp/tools/registry.py
 import asyncio
+import functools
 import inspect
 import logging
-from typing import Any, Callable, Dict, List, final
+import sys
+import typing
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple, final
 
 from pymcp.protocols.tools_def import ToolArgument, ToolDefinition
 
 logger = logging.getLogger(__name__)
 
+# Flyweight pool for argument descriptors: across a large tool set the
+# (name, type, required) triples repeat heavily, so identical descriptors
+# are shared rather than re-allocated per tool. ToolArgument is frozen,
+# which makes the sharing safe.
+_ARG_POOL: Dict[Tuple[str, str, bool], ToolArgument] = {}
+
+
+def _pooled_argument(name: str, param_type: str, required: bool) -> ToolArgument:
+    """Returns the shared ToolArgument for a (name, type, required) triple."""
+    key = (sys.intern(name), sys.intern(param_type), required)
+    argument = _ARG_POOL.get(key)
+    if argument is None:
+        argument = _ARG_POOL[key] = ToolArgument(
+            name=key[0], type=key[1], required=required
+        )
+    return argument
+
+
+# Common annotations resolve through one dict probe instead of an
+# attribute lookup; the keys are the type objects themselves.
+_TYPE_NAMES = {
+    int: "int",
+    str: "str",
+    bool: "bool",
+    float: "float",
+    bytes: "bytes",
+    list: "list",
+    dict: "dict",
+    type(None): "null",
+}
+
+
+def _type_name(annotation: Any) -> str:
+    """
+    Maps an annotation to its public type string. Falls back to the
+    generic's origin (so `list[int]` reports "list") and finally to the
+    annotation's own name, with "any" for anything unrecognizable.
+    """
+    name = _TYPE_NAMES.get(annotation)
+    if name is None:
+        origin = typing.get_origin(annotation)
+        name = _TYPE_NAMES.get(origin) or getattr(annotation, "__name__", "any")
+    return name
+
+
+# CO_VARARGS | CO_VARKEYWORDS: either disables the fast introspection path.
+_CO_VARARGS_OR_VARKEYWORDS = 0x04 | 0x08
+
+
+def _fast_introspect(func: Callable) -> Tuple[List[str], List[ToolArgument]] | None:
+    """
+    Derives (parameter names, public arguments) straight from the code
+    object, `__annotations__` and `__defaults__`/`__kwdefaults__`,
+    skipping inspect.signature's Parameter/OrderedDict construction.
+
+    Returns None for callables that need the full signature machinery:
+    C-implemented or partial()-wrapped callables (no `__code__`), bound
+    methods, and functions with *args/**kwargs or positional-only
+    parameters.
+    """
+    code = getattr(func, "__code__", None)
+    if (
+        code is None
+        or code.co_flags & _CO_VARARGS_OR_VARKEYWORDS
+        or code.co_posonlyargcount
+    ):
+        return None
+    pos_count = code.co_argcount
+    names = code.co_varnames[: pos_count + code.co_kwonlyargcount]
+    if "self" in names:
+        return None
+    annotations = getattr(func, "__annotations__", {})
+    defaults = func.__defaults__ or ()
+    kwdefaults = func.__kwdefaults__ or {}
+    required_cutoff = pos_count - len(defaults)
+    arguments = []
+    for i, name in enumerate(names):
+        if name == Tool.INJECTED_REGISTRY_PARAM:
+            continue
+        annotation = annotations.get(name)
+        param_type = _type_name(annotation) if annotation is not None else "any"
+        required = i < required_cutoff if i < pos_count else name not in kwdefaults
+        arguments.append(_pooled_argument(name, param_type, required))
+    return list(names), arguments
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """
+    Memoized inspect.signature: wrapping the same function in several
+    Tools (or re-registering on hot reload) should not repeat the costly
+    signature construction.
+    """
+    return inspect.signature(func)
+
+
+def _build_call_adapter(param_names: List[str]) -> Callable | None:
+    """
+    Generates `adapter(f, a) -> f(x=a["x"], ...)` for a tool's exact
+    parameter list. Binding arguments through generated code replaces the
+    per-call `**` dict unpack with direct indexed lookups.
+    """
+    if not param_names:
+        return None
+    source = "def adapter(f, a):\n    return f({})".format(
+        ", ".join(f"{name}=a[{name!r}]" for name in param_names)
+    )
+    namespace: dict = {}
+    exec(source, namespace)
+    return namespace["adapter"]
+
 
 @final
 class Tool:
@@ -20,89 +135,232 @@ class Tool:
     # This makes the mechanism clear and avoids magic strings.
     INJECTED_REGISTRY_PARAM = "tool_registry"
 
-    def __init__(self, name: str, func: Callable, description: str):
-        self.name = name
+    # Tools are allocated per registry rebuild (every hot reload); slots
+    # drop the per-instance dict. `execute` and `dispatch` are listed
+    # because the specialized variants are bound per instance.
+    __slots__ = (
+        "name",
+        "func",
+        "description",
+        "cpu_bound",
+        "inline",
+        "source_path",
+        "is_coro",
+        "needs_registry",
+        "arguments",
+        "_adapter",
+        "_adapter_arity",
+        "_submit",
+        "execute",
+        "dispatch",
+        "_definition",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable,
+        description: str,
+        cpu_bound: bool = False,
+        inline: bool = False,
+        source_path: str | None = None,
+    ):
+        # Interned: registry lookups against other interned copies of the
+        # name can short-circuit on identity instead of comparing bytes.
+        self.name = sys.intern(name)
         self.func = func
         self.description = description
-        # Introspect arguments upon initialization.
-        self.arguments = self._introspect_args(func)
+        # CPU-bound sync tools are dispatched to a process pool by the server.
+        self.cpu_bound = cpu_bound
+        # Inline sync tools run directly on the event loop: the author has
+        # declared them cheap enough that the thread hop costs more than
+        # the work itself.
+        self.inline = inline
+        # Where the tool was loaded from. Dynamically loaded functions are
+        # not picklable, so process-pool workers re-import them by path.
+        self.source_path = source_path
+        # iscoroutinefunction walks __wrapped__ chains; resolve it once.
+        self.is_coro = inspect.iscoroutinefunction(func)
+        # Introspect once here; resolving per call is costly. Plain annotated
+        # functions take the fast path over the code object; everything else
+        # (C callables, partials, *args/**kwargs) goes through the signature.
+        fast = _fast_introspect(func)
+        if fast is not None:
+            plain_params, self.arguments = fast
+            adapter_eligible = True
+        else:
+            sig = _cached_signature(inspect.unwrap(func))
+            self.arguments = self._introspect_args(sig)
+            plain_params = [
+                p.name
+                for p in sig.parameters.values()
+                if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+                and p.name != "self"
+            ]
+            # *args/**kwargs or positional-only params: no specialization.
+            adapter_eligible = len(plain_params) == len(sig.parameters)
+        # The @tool decorator marks injection needs straight from the code
+        # object; fall back to the parameter list for undecorated callables.
+        needs_registry = getattr(func, "_mcp_needs_registry", None)
+        if needs_registry is None:
+            needs_registry = self.INJECTED_REGISTRY_PARAM in plain_params
+        self.needs_registry = needs_registry
+        # Specialized call adapter, usable whenever a call supplies every
+        # parameter; calls with omitted defaults fall back to ** unpacking.
+        self._adapter = (
+            _build_call_adapter(plain_params) if adapter_eligible else None
+        )
+        self._adapter_arity = len(plain_params)
+        # One closure allocated per tool, not per call: the sync fallback
+        # submits it to the executor instead of building a fresh partial.
+        self._submit = lambda kwargs, f=func: f(**kwargs)
+        # Specialize dispatch at construction: the async/sync/inline
+        # decision is taken once here, not per call, and the chosen bound
+        # method is stored so the executor's hot path never resolves a
+        # descriptor.
+        if self.is_coro:
+            self.execute = self._exec_coro
+        elif inline:
+            self.execute = self._exec_inline
+        else:
+            self.execute = self._exec_sync
+        self.dispatch = self.execute
+        # The definition is immutable; build it once instead of per lookup.
+        self._definition = ToolDefinition(
+            name=self.name, description=description, args=self.arguments
+        )
 
-    def _introspect_args(self, func: Callable) -> List[ToolArgument]:
+    def _introspect_args(self, sig: inspect.Signature) -> List[ToolArgument]:
         """
-        Inspects a function's signature to build the list of public arguments.
+        Builds the list of public arguments from an inspected signature.
         It explicitly ignores 'self' and the special dependency-injected
         'tool_registry' parameter.
         """
-        sig = inspect.signature(func)
         args = []
+        # Bound once: `empty` is a singleton, so identity checks suffice,
+        # and the repeated module-attribute loads stay out of the loop.
+        empty = inspect.Parameter.empty
         for param in sig.parameters.values():
             # Skip parameters that are not part of the public tool API.
             if param.name in ("self", self.INJECTED_REGISTRY_PARAM):
                 continue
 
             # Determine type from annotation, defaulting to 'any'.
-            param_type = (
-                str(param.annotation.__name__)
-                if hasattr(param.annotation, "__name__")
-                else "any"
-            )
-            if param.annotation == inspect.Parameter.empty:
-                param_type = "any"
+            annotation = param.annotation
+            param_type = _type_name(annotation) if annotation is not empty else "any"
 
             args.append(
-                ToolArgument(
-                    name=param.name,
-                    type=param_type,
-                    required=param.default is inspect.Parameter.empty,
-                )
+                _pooled_argument(param.name, param_type, param.default is empty)
             )
         return args
 
-    async def execute(self, **kwargs: Any) -> Any:
+    async def _exec_coro(self, args: Dict[str, Any]) -> Any:
+        """Executes a coroutine tool with the given argument dict."""
+        adapter = self._adapter
+        if adapter is not None and len(args) == self._adapter_arity:
+            return await adapter(self.func, args)
+        return await self.func(**args)
+
+    async def _exec_inline(self, args: Dict[str, Any]) -> Any:
         """
-        Executes the tool with the given keyword arguments.
-        Runs synchronous functions in a separate thread to avoid blocking
-        the asyncio event loop.
+        Executes a declaratively cheap sync tool directly on the event
+        loop, skipping the thread hop entirely. The tool author vouches
+        that the call never blocks.
         """
-        if inspect.iscoroutinefunction(self.func):
-            return await self.func(**kwargs)
-        else:
-            # `asyncio.to_thread` is the modern way to run blocking IO-bound
-            # or short-running CPU-bound code in an async application.
-            return await asyncio.to_thread(self.func, **kwargs)
+        adapter = self._adapter
+        if adapter is not None and len(args) == self._adapter_arity:
+            return adapter(self.func, args)
+        return self.func(**args)
+
+    async def _exec_sync(self, args: Dict[str, Any]) -> Any:
+        """
+        Executes a blocking tool on the loop's default executor (sized by
+        the server at startup); run_in_executor skips the contextvars
+        copy that asyncio.to_thread performs per call.
+        """
+        adapter = self._adapter
+        loop = asyncio.get_running_loop()
+        if adapter is not None and len(args) == self._adapter_arity:
+            return await loop.run_in_executor(None, adapter, self.func, args)
+        return await loop.run_in_executor(None, self._submit, args)
 
     def get_definition(self) -> ToolDefinition:
         """Returns the serializable definition of the tool."""
-        return ToolDefinition(
-            name=self.name,
-            description=self.description,
-            args=self.arguments,
-        )
+        return self._definition
 
 
 class ToolRegistry:
     """Manages the registration and lookup of available tools."""
 
     def __init__(self):
-        self._tools: Dict[str, Tool] = {}
+        # Copy-on-write: readers always see an immutable snapshot, so
+        # get_tool and get_all_definitions need no lock or defensive copy
+        # even if a register races them. Registration is O(n), which is
+        # the right trade for a register-once/lookup-many registry.
+        self._tools: Mapping[str, Tool] = MappingProxyType({})
+        # Definitions are requested far more often than tools are registered,
+        # so the name-sorted list is rebuilt on register and
+        # get_all_definitions is a constant-time return.
+        self._sorted_names: List[str] = []
+        self._sorted_definitions: List[ToolDefinition] = []
+        # JSON-ready counterpart of the definitions, cached because
+        # discovery responses should not re-dump Pydantic models.
+        self._definitions_dump_cache: List[dict] | None = None
 
     def register(self, tool: Tool):
         """Registers a new tool."""
-        if tool.name in self._tools:
-            # Raise a more specific error for developers.
-            raise ValueError(
-                f"Tool name collision: A tool named '{tool.name}' is already registered."
-            )
-        logger.debug("Registering tool: %s", tool.name)
-        self._tools[tool.name] = tool
+        self.register_many((tool,))
+
+    def register_many(self, tools: Iterable[Tool]):
+        """
+        Registers a batch of tools, rebuilding the derived indexes once.
+
+        Registering one tool at a time rebuilds the copy-on-write snapshots
+        per tool, which is quadratic over a large tool set; the loader
+        registers each file's tools through here instead.
+        """
+        new_tools = dict(self._tools)
+        for tool in tools:
+            if tool.name in new_tools:
+                # Raise a more specific error for developers. Nothing has
+                # been published yet, so the registry is left untouched.
+                raise ValueError(
+                    f"Tool name collision: A tool named '{tool.name}' is already registered."
+                )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Registering tool: %s", tool.name)
+            new_tools[tool.name] = tool
+        if len(new_tools) == len(self._tools):
+            return
+        new_names = sorted(new_tools)
+        # Publish the new snapshots only once they are fully built; each
+        # assignment is atomic, and readers hold references to the old
+        # objects at worst.
+        self._tools = MappingProxyType(new_tools)
+        self._sorted_names = new_names
+        self._sorted_definitions = [
+            new_tools[name].get_definition() for name in new_names
+        ]
+        self._definitions_dump_cache = None
 
     def get_tool(self, name: str) -> Tool | None:
         """Retrieves a tool by its name."""
         return self._tools.get(name)
 
     def get_all_definitions(self) -> List[ToolDefinition]:
-        """Returns a list of all tool definitions."""
-        return sorted(
-            [tool.get_definition() for tool in self._tools.values()],
-            key=lambda t: t.name,
-        )
+        """Returns the tool definitions, sorted by name."""
+        return self._sorted_definitions
+
+    def get_all_definitions_dump(self) -> List[dict]:
+        """
+        Returns the tool definitions as plain JSON-compatible dicts.
+
+        This is what discovery responses actually serialize, so the dump is
+        computed once per registry generation instead of per request.
+        """
+        if self._definitions_dump_cache is None:
+            self._definitions_dump_cache = [
+                definition.model_dump(mode="json")
+                for definition in self.get_all_definitions()
+            ]
+        return self._definitions_dump_cache